@@ -0,0 +1,86 @@
+from __future__ import annotations
+import numpy as np
+
+from technical_test_fortis.vehicle import (
+    Car, Motorbike, Vehicle,
+    CAR_EFFICIENCY_THRESHOLD_YEAR, CAR_OLD_EFFICIENCY_FACTOR,
+    MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR, MOTORBIKE_OLD_EFFICIENCY_FACTOR,
+    MAX_LEAN_ANGLE,
+)
+from technical_test_fortis.kernels import _car_kernel, _motorbike_kernel
+
+# Vectorized counterparts of the calculate_*_distance functions.
+# Vehicles are laid out as one array per field (structure of arrays) and
+# errors are reported as NaN instead of Err, since a Result per element
+# would bring back the per-vehicle Python overhead.
+
+
+def calculate_car_distances_bulk(
+    years: np.ndarray,
+    fcs: np.ndarray,
+    dists: np.ndarray,
+    inspections: np.ndarray,
+) -> np.ndarray:
+    efficiency_factor = np.where(years < CAR_EFFICIENCY_THRESHOLD_YEAR, CAR_OLD_EFFICIENCY_FACTOR, 1.0)
+    out = _car_kernel(fcs, dists, efficiency_factor)
+    return np.where(np.asarray(inspections, dtype=bool), out, np.nan)
+
+
+def calculate_motorbike_distances_bulk(
+    years: np.ndarray,
+    fcs: np.ndarray,
+    dists: np.ndarray,
+    rider_weights: np.ndarray,
+    lean_angles: np.ndarray,
+    helmets: np.ndarray,
+) -> np.ndarray:
+    year_factor = np.where(years < MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR, MOTORBIKE_OLD_EFFICIENCY_FACTOR, 1.0)
+    out = _motorbike_kernel(fcs, dists, rider_weights, lean_angles, year_factor)
+    valid = np.asarray(helmets, dtype=bool) & (lean_angles <= MAX_LEAN_ANGLE)
+    return np.where(valid, out, np.nan)
+
+
+def calculate_distances_bulk(vehicles: list[Vehicle]) -> np.ndarray:
+    """Distances for a mixed fleet, NaN where calculate_distance would return Err."""
+    out = np.full(len(vehicles), np.nan)
+
+    car_idx = [i for i, v in enumerate(vehicles) if isinstance(v, Car)]
+    if car_idx:
+        cars = [vehicles[i] for i in car_idx]
+        out[car_idx] = calculate_car_distances_bulk(
+            np.array([c.year for c in cars]),
+            np.array([c.fuel_consumption for c in cars], dtype=np.float64),
+            np.array([c.distance for c in cars], dtype=np.float64),
+            np.array([c.inspection_passed for c in cars], dtype=np.bool_),
+        )
+
+    bike_idx = [i for i, v in enumerate(vehicles) if isinstance(v, Motorbike)]
+    if bike_idx:
+        bikes = [vehicles[i] for i in bike_idx]
+        out[bike_idx] = calculate_motorbike_distances_bulk(
+            np.array([b.year for b in bikes]),
+            np.array([b.fuel_consumption for b in bikes], dtype=np.float64),
+            np.array([b.distance for b in bikes], dtype=np.float64),
+            np.array([b.rider_weight for b in bikes], dtype=np.float64),
+            np.array([b.lean_angle for b in bikes], dtype=np.float64),
+            np.array([b.helmet_worn for b in bikes], dtype=np.bool_),
+        )
+
+    return out
+
+
+def find_best_vehicle_batch(vs1: list[Vehicle], vs2: list[Vehicle]) -> np.ndarray:
+    """Pairwise find_best_vehicle: 0 where vs1[i] wins, 1 where vs2[i] wins.
+
+    Ties go to vs1 like the scalar version. Pairs where both vehicles have
+    errors, which find_best_vehicle reports as Err, come back as -1.
+    """
+    if len(vs1) != len(vs2):
+        raise ValueError("Both fleets must have the same number of vehicles")
+    d1 = calculate_distances_bulk(vs1)
+    d2 = calculate_distances_bulk(vs2)
+    nan1 = np.isnan(d1)
+    nan2 = np.isnan(d2)
+    best = np.where(nan2 | (d1 >= d2), 0, 1)
+    best[nan1 & nan2] = -1
+    return best
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from numba import vectorize
+
+from technical_test_fortis.vehicle import STANDARD_RIDER_WEIGHT, _LEAN_COEF, _INV_1000
+
+# Numba compiled versions of the distance arithmetic. The explicit signatures
+# make numba compile at import time instead of on the first call. The
+# kernels are ufuncs, so a whole array goes through one compiled loop; the
+# guards and error masking stay in bulk.py.
+
+
+@vectorize(["float64(float64, float64, float64)"], cache=True, fastmath=True)
+def _car_kernel(fc, d, efficiency_factor):
+    return (d / (fc / 100.0)) * efficiency_factor
+
+
+@vectorize(["float64(float64, float64, float64, float64, float64)"], cache=True, fastmath=True)
+def _motorbike_kernel(fc, d, rw, la, year_factor):
+    return (
+        d * 100.0 / fc
+        * (1.0 - (rw - STANDARD_RIDER_WEIGHT) * _INV_1000)
+        * (1.0 + la * _LEAN_COEF)
+        * year_factor
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Union
-from dataclasses import dataclass
+from typing import ClassVar, Union
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from result import Result, Ok, Err
 
@@ -14,35 +14,46 @@ MAX_LEAN_ANGLE = 45
 STANDARD_RIDER_WEIGHT = 70  # kg
 MAX_LEAN_ANGLE_FACTOR = 0.1
 
+# Folded coefficients for the motorbike formula
+_LEAN_COEF = MAX_LEAN_ANGLE_FACTOR / 90
+_INV_1000 = 0.001
+
 
 class InvalidValueError(ValueError):
     pass
 
 
-def validate_positive(value: float, name: str) -> float:
+_YEAR_ERR = f"Year must be between 1900 and {CURRENT_YEAR}"
+_ANGLE_ERR = "Angle must be between 0 and 360 degrees"
+
+
+def validate_positive(value: float, message: str) -> float:
     if value <= 0:
-        raise InvalidValueError(f"{name} must be positive")
+        raise InvalidValueError(message)
     return value
 
 
-def validate_non_negative(value: float, name: str) -> float:
+def validate_non_negative(value: float, message: str) -> float:
     if value < 0:
-        raise InvalidValueError(f"{name} must be non-negative")
+        raise InvalidValueError(message)
+    return value
+
+
+def make_year(value: int) -> int:
+    if not 1900 <= value <= CURRENT_YEAR:
+        raise InvalidValueError(_YEAR_ERR)
     return value
 
 
-class Year:
-    def __init__(self, value: int):
-        if not 1900 <= value <= CURRENT_YEAR:
-            raise InvalidValueError(f"Year must be between 1900 and {CURRENT_YEAR}")
-        self.value = value
+def make_angle(value: float) -> float:
+    if not 0 <= value <= 360:
+        raise InvalidValueError(_ANGLE_ERR)
+    return value
 
 
-class Angle:
-    def __init__(self, value: float):
-        if not 0 <= value <= 360:
-            raise InvalidValueError("Angle must be between 0 and 360 degrees")
-        self.value = value
+# Kept under the old constructor names so existing call sites read the same
+Year = make_year
+Angle = make_angle
 
 
 class VehicleError(Enum):
@@ -58,99 +69,173 @@ class BikeError(Enum):
     EXCESSIVE_LEAN_ANGLE = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class BaseVehicle:
-    year: Year
+    # Age penalty applied below the threshold year; a generic vehicle has none
+    _old_year_threshold: ClassVar[int] = 0
+    _old_efficiency_factor: ClassVar[float] = 1.0
+    # (field, message) pairs checked with validate_positive; subclasses extend it
+    _positive_fields: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("fuel_consumption", "Fuel consumption must be positive"),
+    )
+
+    year: int
     fuel_consumption: float  # LitersPer100Km
     distance: float  # Kilometers
+    # Year-based factor, fixed at construction
+    _efficiency_factor: float = field(init=False)
 
     def __post_init__(self):
-        validate_positive(self.fuel_consumption, "Fuel consumption")
-        validate_non_negative(self.distance, "Distance")
+        for name, message in self._positive_fields:
+            validate_positive(getattr(self, name), message)
+        validate_non_negative(self.distance, "Distance must be non-negative")
+        object.__setattr__(
+            self, "_efficiency_factor",
+            self._old_efficiency_factor if self.year < self._old_year_threshold else 1.0
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class Car(BaseVehicle):
+    _old_year_threshold: ClassVar[int] = CAR_EFFICIENCY_THRESHOLD_YEAR
+    _old_efficiency_factor: ClassVar[float] = CAR_OLD_EFFICIENCY_FACTOR
+
     inspection_passed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
 class Motorbike(BaseVehicle):
+    _old_year_threshold: ClassVar[int] = MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR
+    _old_efficiency_factor: ClassVar[float] = MOTORBIKE_OLD_EFFICIENCY_FACTOR
+    _positive_fields: ClassVar[tuple[tuple[str, str], ...]] = BaseVehicle._positive_fields + (
+        ("rider_weight", "Rider weight must be positive"),
+    )
+
     rider_weight: float  # Kilograms
-    lean_angle: Angle
+    lean_angle: float  # Degrees
     helmet_worn: bool
 
-    def __post_init__(self):
-        super().__post_init__()
-        validate_positive(self.rider_weight, "Rider weight")
-
 
 Vehicle = Union[Car, Motorbike]
 
 
+# The error values never change, so each Err is built once and shared
+_ERR_FAILED_INSPECTION = Err(CarError.FAILED_INSPECTION)
+_ERR_HELMET = Err(BikeError.HELMET_NOT_WORN)
+_ERR_LEAN = Err(BikeError.EXCESSIVE_LEAN_ANGLE)
+_ERR_UNKNOWN = Err(VehicleError.UNKNOWN_VEHICLE_TYPE)
+
+_ERR_RESULTS: dict[Union[VehicleError, CarError, BikeError], Err] = {
+    CarError.FAILED_INSPECTION: _ERR_FAILED_INSPECTION,
+    BikeError.HELMET_NOT_WORN: _ERR_HELMET,
+    BikeError.EXCESSIVE_LEAN_ANGLE: _ERR_LEAN,
+    VehicleError.UNKNOWN_VEHICLE_TYPE: _ERR_UNKNOWN,
+}
+
+
+def _to_result(
+    pair: tuple[float | None, Union[VehicleError, CarError, BikeError] | None]
+) -> Result[float, Union[VehicleError, CarError, BikeError]]:
+    distance, error = pair
+    if error is None:
+        return Ok(distance)
+    return _ERR_RESULTS[error]
+
+
+# Internally the distance functions return a (distance, error) pair with None
+# in the unused slot, so the hot path doesn't allocate a Result; the public
+# functions convert at the boundary.
+def _car_distance(car: Car) -> tuple[float | None, CarError | None]:
+    if not car.inspection_passed:
+        return (None, CarError.FAILED_INSPECTION)
+    fc = car.fuel_consumption
+    d = car.distance
+    max_distance = (d / (fc / 100)) * car._efficiency_factor
+    return (max_distance, None)
+
+
+def _motorbike_distance(motorbike: Motorbike) -> tuple[float | None, BikeError | None]:
+    # Cheap guards first so the error paths never touch the remaining attributes
+    if not motorbike.helmet_worn:
+        return (None, BikeError.HELMET_NOT_WORN)
+    la = motorbike.lean_angle
+    if la > MAX_LEAN_ANGLE:
+        return (None, BikeError.EXCESSIVE_LEAN_ANGLE)
+    fc = motorbike.fuel_consumption
+    d = motorbike.distance
+    rw = motorbike.rider_weight
+    # base distance * weight factor * lean factor * year factor
+    max_distance = (
+        d * 100 / fc
+        * (1 - (rw - STANDARD_RIDER_WEIGHT) * _INV_1000)
+        * (1 + la * _LEAN_COEF)
+        * motorbike._efficiency_factor
+    )
+    return (max_distance, None)
+
+
+def _unknown_distance(vehicle: Vehicle) -> tuple[None, VehicleError]:
+    return (None, VehicleError.UNKNOWN_VEHICLE_TYPE)
+
+
+# Exact-type lookup: one dict probe on type(vehicle) instead of an isinstance chain.
+# Subclasses miss on the first call and are resolved and cached by _resolve_handler.
+_DISPATCH = {
+    Car: _car_distance,
+    Motorbike: _motorbike_distance,
+}
+
+
+def _resolve_handler(vehicle_type: type):
+    if issubclass(vehicle_type, Car):
+        handler = _car_distance
+    elif issubclass(vehicle_type, Motorbike):
+        handler = _motorbike_distance
+    else:
+        return _unknown_distance
+    _DISPATCH[vehicle_type] = handler
+    return handler
+
+
+def _distance(vehicle: Vehicle) -> tuple[float | None, Union[VehicleError, CarError, BikeError] | None]:
+    handler = _DISPATCH.get(type(vehicle))
+    if handler is None:
+        handler = _resolve_handler(type(vehicle))
+    return handler(vehicle)
+
+
 def calculate_car_distance(car: Car) -> Result[float, CarError]:
-    match car:
-        case Car(inspection_passed=False):
-            return Err(CarError.FAILED_INSPECTION)
-        case Car(year=year, fuel_consumption=fc, distance=d):
-            efficiency_factor = CAR_OLD_EFFICIENCY_FACTOR if year.value < CAR_EFFICIENCY_THRESHOLD_YEAR else 1.0
-            max_distance = (d / (fc / 100)) * efficiency_factor
-            return Ok(max_distance)
+    return _to_result(_car_distance(car))
 
 
 def calculate_motorbike_distance(motorbike: Motorbike) -> Result[float, BikeError]:
-    match motorbike:
-        case Motorbike(helmet_worn=False):
-            return Err(BikeError.HELMET_NOT_WORN)
-        case Motorbike(lean_angle=lean_angle) if lean_angle.value > MAX_LEAN_ANGLE:
-            return Err(BikeError.EXCESSIVE_LEAN_ANGLE)
-        case Motorbike(year=year, fuel_consumption=fc, distance=d, rider_weight=rw, lean_angle=lean_angle):
-            base_distance = d / (fc / 100)
-            weight_factor = 1 - (rw - STANDARD_RIDER_WEIGHT) / 1000
-            lean_factor = 1 + (lean_angle.value / 90) * MAX_LEAN_ANGLE_FACTOR
-            year_factor = MOTORBIKE_OLD_EFFICIENCY_FACTOR if year.value < MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR else 1.0
-            max_distance = base_distance * weight_factor * lean_factor * year_factor
-            return Ok(max_distance)
+    return _to_result(_motorbike_distance(motorbike))
 
 
 def calculate_distance(vehicle: Vehicle) -> Result[float, Union[VehicleError, CarError, BikeError]]:
-    match vehicle:
-        case Car():
-            return calculate_car_distance(vehicle)
-        case Motorbike():
-            return calculate_motorbike_distance(vehicle)
-        case _:
-            return Err(VehicleError.UNKNOWN_VEHICLE_TYPE)
+    return _to_result(_distance(vehicle))
 
 
 def find_best_vehicle(vehicle1: Vehicle, vehicle2: Vehicle) -> Result[Vehicle, str]:
-    result1 = calculate_distance(vehicle1)
-    result2 = calculate_distance(vehicle2)
-
-    match (result1, result2):
-        case (Ok(distance1), Ok(distance2)):
-            if distance1 > distance2:
-                return Ok(vehicle1)
-            elif distance2 > distance1:
-                return Ok(vehicle2)
-            else:
-                return Ok(vehicle1)  # Arbitrarily choose vehicle1 if distances are equal
-        case (Ok(_), Err(_)):
-            return Ok(vehicle1)
-        case (Err(_), Ok(_)):
-            return Ok(vehicle2)
-        case (Err(error1), Err(error2)):
-            return Err(f"Both vehicles have errors: {error1.name}, {error2.name}")
-        case _:
-            return Err("Unexpected error occurred during comparison")
+    distance1, error1 = _distance(vehicle1)
+    distance2, error2 = _distance(vehicle2)
+
+    if error1 is None and error2 is None:
+        # Arbitrarily choose vehicle1 if distances are equal
+        return Ok(vehicle1 if distance1 >= distance2 else vehicle2)
+    elif error1 is None:
+        return Ok(vehicle1)
+    elif error2 is None:
+        return Ok(vehicle2)
+    else:
+        return Err(f"Both vehicles have errors: {error1.name}, {error2.name}")
 
 
 def print_result(vehicle_type: str, result: Result[float, Union[VehicleError, CarError, BikeError]]) -> None:
-    match result:
-        case Ok(distance):
-            print(f"{vehicle_type} distance: {distance:.2f} km")
-        case Err(error):
-            print(f"{vehicle_type} error: {error.name}")
+    if result.is_ok():
+        print(f"{vehicle_type} distance: {result.ok():.2f} km")
+    else:
+        print(f"{vehicle_type} error: {result.err().name}")
 
 
 def main() -> None:
@@ -173,17 +258,16 @@ def main() -> None:
         bike = Motorbike(Year(2020), 3, 100, 70, Angle(30), True)
         best_vehicle_result = find_best_vehicle(car, bike)
 
-        match best_vehicle_result:
-            case Ok(best_vehicle):
-                print(f"\nBest vehicle is: {type(best_vehicle).__name__}")
-                distance_result = calculate_distance(best_vehicle)
-                match distance_result:
-                    case Ok(distance):
-                        print(f"It can travel {distance:.2f} km")
-                    case Err(error):
-                        print(f"Error calculating distance: {error.name}")
-            case Err(error_message):
-                print(f"Error finding best vehicle: {error_message}")
+        if best_vehicle_result.is_ok():
+            best_vehicle = best_vehicle_result.ok()
+            print(f"\nBest vehicle is: {type(best_vehicle).__name__}")
+            distance_result = calculate_distance(best_vehicle)
+            if distance_result.is_ok():
+                print(f"It can travel {distance_result.ok():.2f} km")
+            else:
+                print(f"Error calculating distance: {distance_result.err().name}")
+        else:
+            print(f"Error finding best vehicle: {best_vehicle_result.err()}")
 
     except InvalidValueError as e:
         print(f"Error creating vehicle: {e}")
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from technical_test_fortis.vehicle import (
+    Year, Angle, Car, Motorbike,
+    calculate_distance, find_best_vehicle, MAX_LEAN_ANGLE,
+)
+from technical_test_fortis.bulk import (
+    calculate_car_distances_bulk, calculate_motorbike_distances_bulk, calculate_distances_bulk,
+    find_best_vehicle_batch,
+)
+
+FLEET = [
+    Car(Year(2020), 5, 100, True),
+    Car(Year(1995), 7, 100, True),
+    Car(Year(2022), 6, 100, False),
+    Motorbike(Year(2020), 3, 100, 70, Angle(30), True),
+    Motorbike(Year(2005), 4, 100, 90, Angle(20), True),
+    Motorbike(Year(2023), 2, 100, 60, Angle(30), False),
+    Motorbike(Year(2023), 2, 100, 60, Angle(MAX_LEAN_ANGLE + 1), True),
+]
+
+def test_bulk_car_distances():
+    result = calculate_car_distances_bulk(
+        np.array([2020, 1995]), np.array([5.0, 5.0]), np.array([100.0, 100.0]), np.array([True, False])
+    )
+    assert pytest.approx(result[0], 0.01) == 2000
+    assert np.isnan(result[1])
+
+def test_bulk_non_bool_masks():
+    cars = calculate_car_distances_bulk(
+        np.array([2020, 2020, 2020]), np.array([5.0, 5.0, 5.0]), np.array([100.0, 100.0, 100.0]), np.array([1, 1, 0])
+    )
+    assert pytest.approx(cars[:2]) == [2000, 2000]
+    assert np.isnan(cars[2])
+    bikes = calculate_motorbike_distances_bulk(
+        np.array([2020, 2020]),
+        np.array([3.0, 3.0]),
+        np.array([100.0, 100.0]),
+        np.array([70.0, 70.0]),
+        np.array([30.0, 30.0]),
+        np.array([1, 0]),
+    )
+    assert bikes[0] > 3333
+    assert np.isnan(bikes[1])
+
+def test_bulk_motorbike_distances():
+    result = calculate_motorbike_distances_bulk(
+        np.array([2020, 2020, 2020]),
+        np.array([3.0, 3.0, 3.0]),
+        np.array([100.0, 100.0, 100.0]),
+        np.array([70.0, 70.0, 70.0]),
+        np.array([30.0, 30.0, MAX_LEAN_ANGLE + 1]),
+        np.array([True, False, True]),
+    )
+    assert result[0] > 3333
+    assert np.isnan(result[1])
+    assert np.isnan(result[2])
+
+def test_bulk_matches_scalar():
+    result = calculate_distances_bulk(FLEET)
+    for vehicle, distance in zip(FLEET, result):
+        expected = calculate_distance(vehicle)
+        if expected.is_ok():
+            assert pytest.approx(distance) == expected.unwrap()
+        else:
+            assert np.isnan(distance)
+
+def test_bulk_matches_scalar_for_subclass():
+    class SUV(Car):
+        pass
+    suv = SUV(Year(2020), 5, 100, True)
+    assert pytest.approx(calculate_distances_bulk([suv])[0]) == calculate_distance(suv).unwrap()
+
+@pytest.mark.parametrize("fleet2", [FLEET[::-1], FLEET[1:] + FLEET[:1]])
+def test_find_best_vehicle_batch_matches_scalar(fleet2):
+    result = find_best_vehicle_batch(FLEET, fleet2)
+    for v1, v2, best in zip(FLEET, fleet2, result):
+        expected = find_best_vehicle(v1, v2)
+        if expected.is_ok():
+            assert (v1, v2)[best] is expected.unwrap()
+        else:
+            assert best == -1
+
+def test_find_best_vehicle_batch_length_mismatch():
+    with pytest.raises(ValueError):
+        find_best_vehicle_batch(FLEET, FLEET[:-1])
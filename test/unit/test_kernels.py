@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from technical_test_fortis.vehicle import (
+    Year, Angle, Car, Motorbike,
+    calculate_car_distance, calculate_motorbike_distance,
+    CAR_EFFICIENCY_THRESHOLD_YEAR, MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR,
+)
+from technical_test_fortis.kernels import _car_kernel, _motorbike_kernel
+
+def test_car_kernel_matches_scalar():
+    cars = [
+        Car(Year(2020), 5, 100, True),
+        Car(Year(CAR_EFFICIENCY_THRESHOLD_YEAR - 1), 7, 100, True),
+    ]
+    result = _car_kernel(
+        np.array([c.fuel_consumption for c in cars], dtype=np.float64),
+        np.array([c.distance for c in cars], dtype=np.float64),
+        np.array([c._efficiency_factor for c in cars]),
+    )
+    expected = [calculate_car_distance(c).unwrap() for c in cars]
+    assert pytest.approx(result) == expected
+
+def test_motorbike_kernel_matches_scalar():
+    bikes = [
+        Motorbike(Year(2020), 3, 100, 70, Angle(30), True),
+        Motorbike(Year(MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR - 1), 4, 100, 90, Angle(20), True),
+        Motorbike(Year(2023), 2, 100, 60, Angle(0), True),
+    ]
+    result = _motorbike_kernel(
+        np.array([b.fuel_consumption for b in bikes], dtype=np.float64),
+        np.array([b.distance for b in bikes], dtype=np.float64),
+        np.array([b.rider_weight for b in bikes], dtype=np.float64),
+        np.array([b.lean_angle for b in bikes], dtype=np.float64),
+        np.array([b._efficiency_factor for b in bikes]),
+    )
+    expected = [calculate_motorbike_distance(b).unwrap() for b in bikes]
+    assert pytest.approx(result) == expected
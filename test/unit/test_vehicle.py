@@ -1,7 +1,7 @@
 import pytest
 from result import Ok, Err
 from technical_test_fortis.vehicle import (  # Replace 'your_module_name' with the actual module name
-    Year, Angle, Car, Motorbike, Vehicle,
+    Year, Angle, BaseVehicle, Car, Motorbike, Vehicle,
     VehicleError, CarError, BikeError,
     calculate_distance, find_best_vehicle, InvalidValueError,
     CURRENT_YEAR, MAX_LEAN_ANGLE,
@@ -9,9 +9,9 @@ from technical_test_fortis.vehicle import (  # Replace 'your_module_name' with t
     MOTORBIKE_EFFICIENCY_THRESHOLD_YEAR, MOTORBIKE_OLD_EFFICIENCY_FACTOR
 )
 
-# Test Year and Angle classes
+# Test Year and Angle validators
 def test_valid_year():
-    assert Year(2000).value == 2000
+    assert Year(2000) == 2000
 
 def test_invalid_year():
     with pytest.raises(InvalidValueError):
@@ -20,7 +20,7 @@ def test_invalid_year():
         Year(1899)
 
 def test_valid_angle():
-    assert Angle(45).value == 45
+    assert Angle(45) == 45
 
 def test_invalid_angle():
     with pytest.raises(InvalidValueError):
@@ -31,7 +31,7 @@ def test_invalid_angle():
 # Test vehicle creation
 def test_valid_car_creation():
     car = Car(Year(2020), 5, 100, True)
-    assert car.year.value == 2020
+    assert car.year == 2020
     assert car.fuel_consumption == 5
     assert car.distance == 100
     assert car.inspection_passed == True
@@ -42,19 +42,31 @@ def test_invalid_car_creation():
     with pytest.raises(InvalidValueError):
         Car(Year(2020), 5, -100, True)
 
+def test_base_vehicle_creation():
+    vehicle = BaseVehicle(Year(2020), 5, 100)
+    assert vehicle._efficiency_factor == 1.0
+
 def test_valid_motorbike_creation():
     bike = Motorbike(Year(2020), 3, 100, 70, Angle(30), True)
-    assert bike.year.value == 2020
+    assert bike.year == 2020
     assert bike.fuel_consumption == 3
     assert bike.distance == 100
     assert bike.rider_weight == 70
-    assert bike.lean_angle.value == 30
+    assert bike.lean_angle == 30
     assert bike.helmet_worn == True
 
 def test_invalid_motorbike_creation():
     with pytest.raises(InvalidValueError):
         Motorbike(Year(2020), 3, 100, -70, Angle(30), True)
 
+def test_validation_messages():
+    with pytest.raises(InvalidValueError, match="Fuel consumption must be positive"):
+        Motorbike(Year(2020), -3, 100, 70, Angle(30), True)
+    with pytest.raises(InvalidValueError, match="Distance must be non-negative"):
+        Car(Year(2020), 5, -100, True)
+    with pytest.raises(InvalidValueError, match="Rider weight must be positive"):
+        Motorbike(Year(2020), 3, 100, -70, Angle(30), True)
+
 # Test calculate_distance function
 def test_calculate_car_distance():
     car = Car(Year(2020), 5, 100, True)
@@ -140,6 +152,20 @@ def test_find_best_vehicle_both_errors():
 #    assert isinstance(result, Err)
 #    assert result.unwrap_err() == VehicleError.UNKNOWN_VEHICLE_TYPE
 
+def test_unknown_vehicle_type_is_err():
+    result = calculate_distance(object())  # type: ignore
+    assert isinstance(result, Err)
+    assert result.unwrap_err() == VehicleError.UNKNOWN_VEHICLE_TYPE
+
+def test_vehicle_subclass_dispatch():
+    class SUV(Car):
+        pass
+    result = calculate_distance(SUV(Year(2020), 5, 100, True))
+    assert isinstance(result, Ok)
+    assert pytest.approx(result.unwrap(), 0.01) == 2000
+    # Second call goes through the cached handler
+    assert calculate_distance(SUV(Year(2020), 5, 100, False)).unwrap_err() == CarError.FAILED_INSPECTION
+
 def test_motorbike_weight_factor():
     light_bike = Motorbike(Year(2020), 3, 100, 60, Angle(30), True)
     heavy_bike = Motorbike(Year(2020), 3, 100, 80, Angle(30), True)